@@ -9,15 +9,21 @@ Copyright (C) 2021-2025 Plato Mavropoulos
 
 import contextlib
 import ctypes
+import io
+import mmap
 import os
 import re
 import struct
+import sys
 
-from typing import Any, Final
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Final, TextIO
 
 from biosutilities.common.checksums import checksum_16
 from biosutilities.common.compression import efi_decompress, is_efi_compressed
-from biosutilities.common.paths import agnostic_path, delete_file, extract_folder, make_dirs, safe_name, safe_path
+from biosutilities.common.paths import (agnostic_path, delete_file, extract_folder, make_dirs, path_size,
+                                        safe_name, safe_path)
 from biosutilities.common.patterns import PAT_AMI_UCP, PAT_INTEL_ENGINE
 from biosutilities.common.structs import CHAR, ctypes_struct, UINT8, UINT16, UINT32
 from biosutilities.common.system import printer
@@ -58,15 +64,19 @@ class UafHeader(ctypes.LittleEndianStructure):
 
         return self.ModuleTag.decode('utf-8')
 
-    def struct_print(self, padding: int = 0) -> None:
+    def struct_print(self, padding: int = 0, out_file: TextIO | None = None) -> None:
         """ Display structure information """
 
-        printer(message=['Tag          :', self.get_tag()], padding=padding, new_line=False)
-        printer(message=['Size         :', f'0x{self.ModuleSize:X}'], padding=padding, new_line=False)
-        printer(message=['Checksum     :', f'0x{self.Checksum:04X}'], padding=padding, new_line=False)
-        printer(message=['Unknown 0    :', f'0x{self.Unknown0:02X}'], padding=padding, new_line=False)
-        printer(message=['Unknown 1    :', f'0x{self.Unknown1:02X}'], padding=padding, new_line=False)
-        printer(message=['Reserved     :', self._get_reserved()], padding=padding, new_line=False)
+        printer(message=['Tag          :', self.get_tag()], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Size         :', f'0x{self.ModuleSize:X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Checksum     :', f'0x{self.Checksum:04X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Unknown 0    :', f'0x{self.Unknown0:02X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Unknown 1    :', f'0x{self.Unknown1:02X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Reserved     :', self._get_reserved()], padding=padding, new_line=False, out_file=out_file)
 
 
 class UafModule(ctypes.LittleEndianStructure):
@@ -79,13 +89,16 @@ class UafModule(ctypes.LittleEndianStructure):
         # 0x08
     ]
 
-    def struct_print(self, filename: str, description: str, padding: int = 0) -> None:
+    def struct_print(self, filename: str, description: str, padding: int = 0,
+                     out_file: TextIO | None = None) -> None:
         """ Display structure information """
 
-        printer(message=['Compress Size:', f'0x{self.CompressSize:X}'], padding=padding, new_line=False)
-        printer(message=['Original Size:', f'0x{self.OriginalSize:X}'], padding=padding, new_line=False)
-        printer(message=['Filename     :', filename], padding=padding, new_line=False)
-        printer(message=['Description  :', description], padding=padding, new_line=False)
+        printer(message=['Compress Size:', f'0x{self.CompressSize:X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Original Size:', f'0x{self.OriginalSize:X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Filename     :', filename], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Description  :', description], padding=padding, new_line=False, out_file=out_file)
 
 
 class UiiHeader(ctypes.LittleEndianStructure):
@@ -113,7 +126,7 @@ class UiiHeader(ctypes.LittleEndianStructure):
     PTP: Final[dict[int, str]] = {1: 'Executable', 2: 'Library', 3: 'Driver'}
     PMD: Final[dict[int, str]] = {1: 'API', 2: 'Console', 3: 'GUI', 4: 'Console/GUI'}
 
-    def struct_print(self, description: str, padding: int = 0) -> None:
+    def struct_print(self, description: str, padding: int = 0, out_file: TextIO | None = None) -> None:
         """ Display structure information """
 
         support_bios: str = self.SBI.get(self.SupportBIOS, f'Unknown ({self.SupportBIOS})')
@@ -122,17 +135,20 @@ class UiiHeader(ctypes.LittleEndianStructure):
         program_type: str = self.PTP.get(self.ProgramType, f'Unknown ({self.ProgramType})')
         program_mode: str = self.PMD.get(self.ProgramMode, f'Unknown ({self.ProgramMode})')
 
-        printer(message=['UII Size      :', f'0x{self.UIISize:X}'], padding=padding, new_line=False)
-        printer(message=['Checksum      :', f'0x{self.Checksum:04X}'], padding=padding, new_line=False)
-        printer(message=['Tool Version  :', f'0x{self.UtilityVersion:08X}'], padding=padding, new_line=False)
-        printer(message=['Info Size     :', f'0x{self.InfoSize:X}'], padding=padding, new_line=False)
-        printer(message=['Supported BIOS:', support_bios], padding=padding, new_line=False)
-        printer(message=['Supported OS  :', support_os], padding=padding, new_line=False)
-        printer(message=['Data Bus Width:', data_bus_width], padding=padding, new_line=False)
-        printer(message=['Program Type  :', program_type], padding=padding, new_line=False)
-        printer(message=['Program Mode  :', program_mode], padding=padding, new_line=False)
-        printer(message=['SourceSafe Tag:', f'{self.SourceSafeRel:02d}'], padding=padding, new_line=False)
-        printer(message=['Description   :', description], padding=padding, new_line=False)
+        printer(message=['UII Size      :', f'0x{self.UIISize:X}'], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Checksum      :', f'0x{self.Checksum:04X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Tool Version  :', f'0x{self.UtilityVersion:08X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Info Size     :', f'0x{self.InfoSize:X}'], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Supported BIOS:', support_bios], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Supported OS  :', support_os], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Data Bus Width:', data_bus_width], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Program Type  :', program_type], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Program Mode  :', program_mode], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['SourceSafe Tag:', f'{self.SourceSafeRel:02d}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Description   :', description], padding=padding, new_line=False, out_file=out_file)
 
 
 class DisHeader(ctypes.LittleEndianStructure):
@@ -146,12 +162,14 @@ class DisHeader(ctypes.LittleEndianStructure):
         # 0x10
     ]
 
-    def struct_print(self, padding: int = 0) -> None:
+    def struct_print(self, padding: int = 0, out_file: TextIO | None = None) -> None:
         """ Display structure information """
 
-        printer(message=['Password Size:', f'0x{self.PasswordSize:X}'], padding=padding, new_line=False)
-        printer(message=['Entry Count  :', self.EntryCount], padding=padding, new_line=False)
-        printer(message=['Password     :', self.Password.decode('utf-8')], padding=padding, new_line=False)
+        printer(message=['Password Size:', f'0x{self.PasswordSize:X}'], padding=padding, new_line=False,
+                out_file=out_file)
+        printer(message=['Entry Count  :', self.EntryCount], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Password     :', self.Password.decode('utf-8')], padding=padding, new_line=False,
+                out_file=out_file)
 
 
 class DisModule(ctypes.LittleEndianStructure):
@@ -169,7 +187,7 @@ class DisModule(ctypes.LittleEndianStructure):
     ENDIS: Final[dict[int, str]] = {0: 'Disabled', 1: 'Enabled'}
     SHOWN: Final[dict[int, str]] = {0: 'Hidden', 1: 'Shown', 2: 'Shown Only'}
 
-    def struct_print(self, padding: int = 0) -> None:
+    def struct_print(self, padding: int = 0, out_file: TextIO | None = None) -> None:
         """ Display structure information """
 
         enabled_disabled: str = self.ENDIS.get(self.EnabledDisabled, f'Unknown ({self.EnabledDisabled})')
@@ -177,10 +195,10 @@ class DisModule(ctypes.LittleEndianStructure):
         command: str = self.Command.decode('utf-8').strip()
         description: str = self.Description.decode('utf-8').strip()
 
-        printer(message=['State      :', enabled_disabled], padding=padding, new_line=False)
-        printer(message=['Display    :', shown_hidden], padding=padding, new_line=False)
-        printer(message=['Command    :', command], padding=padding, new_line=False)
-        printer(message=['Description:', description], padding=padding, new_line=False)
+        printer(message=['State      :', enabled_disabled], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Display    :', shown_hidden], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Command    :', command], padding=padding, new_line=False, out_file=out_file)
+        printer(message=['Description:', description], padding=padding, new_line=False, out_file=out_file)
 
 
 class AmiUcpExtract(BIOSUtility):
@@ -195,6 +213,9 @@ class AmiUcpExtract(BIOSUtility):
     DIS_MOD_LEN: Final[int] = ctypes.sizeof(DisModule)
     UII_HDR_LEN: Final[int] = ctypes.sizeof(UiiHeader)
 
+    # Get @UAF|@HPU Module Header Tag & Size layout
+    UAF_HDR_FMT: Final[struct.Struct] = struct.Struct('<4sIHBBI')
+
     # AMI UCP Tag Dictionary
     UAF_TAG_DICT: Final[dict[str, list[str]]] = {
         '@3FI': ['HpBiosUpdate32.efi', 'HpBiosUpdate32.efi', ''],
@@ -255,20 +276,64 @@ class AmiUcpExtract(BIOSUtility):
         '@W64': ['amifldrv64.sys', 'amifldrv64.sys', '']
     }
 
+    # AMI UCP Tag Prefix Dictionary (Name, Extension)
+    UAF_PREFIX_DICT: Final[dict[str, tuple[str, str]]] = {
+        '@R0': ('BIOS_0', '.bin'),  # BIOS/PFAT Firmware
+        '@S0': ('BIOS_0', '.sig'),  # BIOS/PFAT Signature
+        '@DR': ('DROM_0', '.bin'),  # Thunderbolt Retimer Firmware
+        '@DS': ('DROM_0', '.sig'),  # Thunderbolt Retimer Signature
+        '@EC': ('EC_0', '.bin'),  # Embedded Controller Firmware
+        '@ME': ('ME_0', '.bin')  # Management Engine Firmware
+    }
+
+    # AMI UCP Tag Prefixes which are expected at @NAL (not reported as new)
+    UAF_NAL_PREFIXES: Final[tuple[str, ...]] = ('@ROM', '@R0', '@S0', '@DR', '@DS')
+
+    # AMI UCP Signature Tag Prefixes
+    UAF_SIG_PREFIXES: Final[frozenset[str]] = frozenset(
+        prefix for prefix, info in UAF_PREFIX_DICT.items() if info[1] == '.sig')
+
+    # AMI UCP Text Tags
+    UAF_TEXT_TAGS: Final[frozenset[str]] = frozenset(tag for tag, info in UAF_TAG_DICT.items() if info[2] == 'Text')
+
+    # AMI UCP Informational Tags (Text, Identification, Command Status, Name List)
+    UAF_INFO_TAGS: Final[frozenset[str]] = UAF_TEXT_TAGS | {'@UII', '@DIS', '@NAL'}
+
     def __init__(self, input_object: str | bytes | bytearray = b'', extract_path: str = '', padding: int = 0,
-                 checksum: bool = False) -> None:
+                 checksum: bool = False, workers: int = 1) -> None:
         super().__init__(input_object=input_object, extract_path=extract_path, padding=padding)
 
         self.checksum: bool = checksum
 
+        self.workers: int = workers
+
+        self._ucp_buffer: memoryview | None = None
+
+        self._input_map: mmap.mmap | None = None
+
     def check_format(self) -> bool:
         """ Check if input is AMI UCP image """
 
-        return bool(self._get_ami_ucp())
+        is_ami_ucp: bool = bool(self._get_ami_ucp())
+
+        if not is_ami_ucp:
+            self._close_input()  # Release input file memory map early, nothing to parse
+
+            self._ucp_buffer = memoryview(b'')  # Keep negative scan result
+
+        return is_ami_ucp
 
     def parse_format(self) -> bool:
         """ Parse & Extract AMI UCP structures """
 
+        try:
+            return self._parse_ami_ucp()
+        finally:
+            self._close_input()  # Unlock input file, no longer needed after extraction
+
+    def _parse_ami_ucp(self) -> bool:
+        """ Parse & Extract AMI UCP structures from best AMI UCP match """
+
         nal_dict: dict[str, tuple[str, str]] = {}  # Initialize @NAL Dictionary per UCP
 
         printer(message='Utility Configuration Program', padding=self.padding)
@@ -276,7 +341,7 @@ class AmiUcpExtract(BIOSUtility):
         make_dirs(in_path=self.extract_path)
 
         # Get best AMI UCP Pattern match based on @UAF|@HPU Size
-        ucp_buffer: bytes = self._get_ami_ucp()
+        ucp_buffer: memoryview = self._get_ami_ucp()
 
         # Parse @UAF|@HPU Header Structure
         uaf_hdr: Any = ctypes_struct(buffer=ucp_buffer, start_offset=0, class_object=UafHeader)
@@ -287,11 +352,8 @@ class AmiUcpExtract(BIOSUtility):
 
         uaf_hdr.struct_print(padding=self.padding + 8)
 
-        # Generate UafModule Structure
-        fake: bytes = struct.pack('<II', len(ucp_buffer), len(ucp_buffer))
-
-        # Parse @UAF|@HPU Module EFI Structure
-        uaf_mod: Any = ctypes_struct(buffer=fake, start_offset=0, class_object=UafModule)
+        # Generate @UAF|@HPU Module EFI Structure
+        uaf_mod: Any = UafModule(CompressSize=len(ucp_buffer), OriginalSize=len(ucp_buffer))
 
         # Get @UAF|@HPU Module Filename
         uaf_name: str = self.UAF_TAG_DICT[ucp_tag][0]
@@ -307,14 +369,99 @@ class AmiUcpExtract(BIOSUtility):
 
         uaf_all: list[list] = self._get_uaf_mod(buffer=ucp_buffer, uaf_off=self.UAF_HDR_LEN)
 
-        for mod_info in uaf_all:
+        # Parse @UAF|@HPU Modules up to @NAL first, as they are required to name all the rest
+        nal_end: int = next((mod_idx + 1 for mod_idx, mod_val in enumerate(uaf_all[:2]) if mod_val[0] == '@NAL'), 0)
+
+        for mod_info in uaf_all[:nal_end]:
             nal_dict = self._uaf_extract(buffer=ucp_buffer, extract_path=self.extract_path, mod_info=mod_info,
                                          nal_dict=nal_dict, padding=self.padding + 8)
 
+        uaf_rest: list[list] = uaf_all[nal_end:]
+
+        uaf_tags: list[str] = [mod_info[0] for mod_info in uaf_rest]
+
+        # Optional worker processes, never more than available CPUs or remaining @UAF|@HPU Modules
+        uaf_workers: int = min(self.workers, os.cpu_count() or 1, len(uaf_rest))
+
+        # Remaining @UAF|@HPU Modules are independent, unless they affect naming (@NAL) or share any output path
+        if uaf_workers > 1 and '@NAL' not in uaf_tags and \
+                self._is_uaf_parallel(buffer=ucp_buffer, mod_all=uaf_rest, nal_dict=nal_dict):
+            sys.stdout.flush()  # Avoid duplicate output of pending text by forked worker processes
+
+            # Lightweight worker instance, without any input buffer to transfer to each worker process
+            # Nested AMI UCP images, parsed within a worker process, are not parallelized any further
+            uaf_worker: AmiUcpExtract = AmiUcpExtract(checksum=self.checksum)
+
+            with ProcessPoolExecutor(max_workers=uaf_workers) as uaf_executor:
+                uaf_pending: deque[Future] = deque()
+
+                for mod_info in uaf_rest:
+                    # Copy each @UAF|@HPU Module data only when submitted, up to one pending task per worker
+                    uaf_pending.append(uaf_executor.submit(
+                        uaf_worker.uaf_extract_task, uaf_data=bytes(ucp_buffer[mod_info[1]:mod_info[1] + mod_info[2]]),
+                        extract_path=self.extract_path, mod_info=[mod_info[0], 0x0, mod_info[2]], nal_dict=nal_dict,
+                        padding=self.padding + 8))
+
+                    if len(uaf_pending) >= uaf_workers:
+                        print(uaf_pending.popleft().result(), end='')  # Show output in original order
+
+                while uaf_pending:
+                    print(uaf_pending.popleft().result(), end='')  # Show output in original order
+        else:
+            for mod_info in uaf_rest:
+                nal_dict = self._uaf_extract(buffer=ucp_buffer, extract_path=self.extract_path, mod_info=mod_info,
+                                             nal_dict=nal_dict, padding=self.padding + 8)
+
         return True
 
+    def _is_uaf_parallel(self, buffer: memoryview, mod_all: list[list], nal_dict: dict[str, tuple[str, str]]) -> bool:
+        """ Check if @UAF|@HPU Modules are worth extracting in parallel, without colliding output paths """
+
+        uaf_outputs: set[str] = set()
+
+        comp_count: int = 0  # EFI/Tiano decompression is the only costly step, worth the process pool overhead
+
+        for mod_info in mod_all:
+            uaf_tag: str = mod_info[0]
+
+            # Parse UAF Module EFI Structure
+            uaf_mod: Any = ctypes_struct(buffer=buffer, start_offset=mod_info[1] + self.UAF_HDR_LEN,
+                                         class_object=UafModule)
+
+            is_comp: bool = uaf_mod.CompressSize != uaf_mod.OriginalSize  # Detect @UAF|@HPU Module EFI Compression
+
+            comp_count += is_comp
+
+            uaf_nal: tuple[str, str] | None = nal_dict.get(uaf_tag)  # @NAL Path & Name, if listed
+
+            uaf_name, uaf_fext = self._get_uaf_name(uaf_tag=uaf_tag, uaf_nal=uaf_nal,
+                                                    uaf_info=self.UAF_TAG_DICT.get(uaf_tag))
+
+            uaf_paths: dict[str, str] = self._get_uaf_paths(
+                extract_path=self.extract_path, uaf_tag=uaf_tag, uaf_name=uaf_name, uaf_fext=uaf_fext,
+                uaf_nal=uaf_nal, is_comp=is_comp)
+
+            mod_outputs: set[str] = {os.path.normcase(os.path.normpath(uaf_path)) for uaf_path in uaf_paths.values()}
+
+            if not uaf_outputs.isdisjoint(mod_outputs):
+                return False
+
+            uaf_outputs.update(mod_outputs)
+
+        return comp_count > 1
+
+    def uaf_extract_task(self, uaf_data: bytes, extract_path: str, mod_info: list,
+                         nal_dict: dict[str, tuple[str, str]], padding: int = 0) -> str:
+        """ Parse & Extract AMI UCP > @UAF|@HPU Module/Section at worker process, capturing its output """
+
+        with io.StringIO() as text_buffer, contextlib.redirect_stdout(text_buffer):
+            self._uaf_extract(buffer=memoryview(uaf_data), extract_path=extract_path, mod_info=mod_info,
+                              nal_dict=nal_dict, padding=padding)
+
+            return text_buffer.getvalue()
+
     @staticmethod
-    def _chk16_validate(data: bytes | bytearray, tag: str, padding: int = 0) -> None:
+    def _chk16_validate(data: bytes | bytearray | memoryview, tag: str, padding: int = 0) -> None:
         """ Validate UCP Module Checksum-16 """
 
         if checksum_16(data=data) != 0:
@@ -322,29 +469,65 @@ class AmiUcpExtract(BIOSUtility):
         else:
             printer(message=f'Checksum of UCP Module {tag} is valid!', padding=padding)
 
-    def _get_ami_ucp(self) -> bytes:
+    def _get_input_data(self) -> bytes | mmap.mmap:
+        """ Get input file read-only memory map or input buffer """
+
+        # Memory map input files, paged in on demand instead of read as a whole
+        if isinstance(self.input_object, str) and path_size(in_path=self.input_object):
+            with open(self.input_object, 'rb') as input_file:
+                self._input_map = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+                return self._input_map
+
+        return self.input_buffer
+
+    def _close_input(self) -> None:
+        """ Release best AMI UCP match buffer and close input file memory map """
+
+        if self._ucp_buffer is not None:
+            self._ucp_buffer.release()  # Memory map cannot be closed while exporting any buffer
+
+            self._ucp_buffer = None
+
+        if self._input_map is not None:
+            # Views still referenced by a propagating exception leave closing to garbage collection
+            with contextlib.suppress(BufferError):
+                self._input_map.close()
+
+            self._input_map = None
+
+    def _get_ami_ucp(self) -> memoryview:
         """ Get all input file AMI UCP patterns """
 
-        uaf_mod_dat_max: bytes = b''
+        if self._ucp_buffer is not None:
+            return self._ucp_buffer  # Already scanned, reuse best AMI UCP match
+
+        input_data: bytes | mmap.mmap = self._get_input_data()
+
+        input_view: memoryview = memoryview(input_data)
+
+        uaf_mod_dat_max: memoryview = input_view[:0]
 
         uaf_mod_len_max: int = 0
 
-        for uaf_match in PAT_AMI_UCP.finditer(self.input_buffer):
-            uaf_mod_off: int = uaf_match.start()
+        # Fast literal pre-scan, skip regex matching when no @UAF|@HPU anchor exists
+        if input_data.find(b'@UAF') == -1 and input_data.find(b'@HPU') == -1:
+            self._ucp_buffer = uaf_mod_dat_max
 
-            uaf_mod_buf: bytes = self.input_buffer[uaf_mod_off:]
+            return self._ucp_buffer
 
-            if len(uaf_mod_buf) <= self.UAF_HDR_LEN:
-                continue
+        for uaf_match in PAT_AMI_UCP.finditer(input_view):
+            uaf_mod_off: int = uaf_match.start()
 
-            uaf_hdr: Any = ctypes_struct(buffer=uaf_mod_buf, start_offset=0, class_object=UafHeader)
+            if len(input_view) - uaf_mod_off <= self.UAF_HDR_LEN:
+                continue
 
-            uaf_mod_len: int = uaf_hdr.ModuleSize
+            uaf_mod_len: int = self.UAF_HDR_FMT.unpack_from(input_view, uaf_mod_off)[1]
 
             if uaf_mod_len < 0x400:
                 continue
 
-            uaf_mod_dat: bytes = uaf_mod_buf[:uaf_mod_len]
+            uaf_mod_dat: memoryview = input_view[uaf_mod_off:uaf_mod_off + uaf_mod_len]
 
             if uaf_mod_len != len(uaf_mod_dat):
                 continue
@@ -357,50 +540,107 @@ class AmiUcpExtract(BIOSUtility):
 
                 uaf_mod_dat_max = uaf_mod_dat
 
-        return uaf_mod_dat_max
+        self._ucp_buffer = uaf_mod_dat_max
 
-    @staticmethod
-    def _get_uaf_mod(buffer: bytes | bytearray, uaf_off: int = 0x0) -> list[list]:
+        return self._ucp_buffer
+
+    def _get_uaf_mod(self, buffer: memoryview, uaf_off: int = 0x0) -> list[list]:
         """ Get list of @UAF|@HPU Modules """
 
         uaf_all: list[list] = []  # Initialize list of all @UAF|@HPU Modules
 
-        while buffer[uaf_off] == 0x40:  # ASCII of @ is 0x40
-            # Parse @UAF|@HPU Module Structure
-            uaf_hdr: Any = ctypes_struct(buffer=buffer, start_offset=uaf_off, class_object=UafHeader)
+        while uaf_off + self.UAF_HDR_LEN <= len(buffer):
+            # Parse @UAF|@HPU Module Header Tag & Size
+            uaf_tag_raw, uaf_size = self.UAF_HDR_FMT.unpack_from(buffer, uaf_off)[:2]
+
+            if uaf_tag_raw[:1] != b'@':
+                break  # Stop parsing at non-@UAF|@HPU Module
 
-            uaf_tag: str = uaf_hdr.get_tag()  # Get unique @UAF|@HPU Module Tag
+            uaf_tag: str = uaf_tag_raw.split(b'\x00', 1)[0].decode('utf-8')  # Get unique @UAF|@HPU Module Tag
 
-            uaf_all.append([uaf_tag, uaf_off, uaf_hdr])  # Store @UAF|@HPU Module Info
+            uaf_all.append([uaf_tag, uaf_off, uaf_size])  # Store @UAF|@HPU Module Info
 
-            uaf_off += uaf_hdr.ModuleSize  # Adjust to next @UAF|@HPU Module offset
+            uaf_off += uaf_size  # Adjust to next @UAF|@HPU Module offset
 
             if uaf_off >= len(buffer):
                 break  # Stop parsing at EOF
 
         # Check if @UAF|@HPU Module @NAL exists and place it first
         # Parsing @NAL first allows naming all @UAF|@HPU Modules
-        for mod_idx, mod_val in enumerate(uaf_all):
-            if mod_val[0] == '@NAL':
-                uaf_all.insert(1, uaf_all.pop(mod_idx))  # After UII for visual purposes
+        nal_idx: int | None = next((mod_idx for mod_idx, mod_val in enumerate(uaf_all) if mod_val[0] == '@NAL'), None)
 
-                break  # @NAL found, skip the rest
+        if nal_idx is not None:
+            uaf_rest: list[list] = uaf_all[:nal_idx] + uaf_all[nal_idx + 1:]  # Only the first @NAL is moved
+
+            uaf_all = uaf_rest[:1] + [uaf_all[nal_idx]] + uaf_rest[1:]  # After UII for visual purposes
 
         return uaf_all
 
-    def _uaf_extract(self, buffer: bytes | bytearray, extract_path: str, mod_info: list,
+    def _get_uaf_name(self, uaf_tag: str, uaf_nal: tuple[str, str] | None,
+                      uaf_info: list[str] | None) -> tuple[str, str]:
+        """ Get @UAF|@HPU Module name & extension """
+
+        if uaf_nal:
+            return uaf_nal[1], '' if uaf_nal[1] != uaf_tag else '.bin'  # Always prefer @NAL naming first
+
+        if uaf_info:
+            return uaf_info[0], ''  # Otherwise use built-in naming
+
+        if uaf_tag == '@ROM':
+            return 'BIOS.bin', ''  # BIOS/PFAT Firmware (w/o Signature)
+
+        uaf_prefix: tuple[str, str] | None = self.UAF_PREFIX_DICT.get(uaf_tag[:3])
+
+        if uaf_prefix:
+            return f'{uaf_prefix[0]}{uaf_tag[3:]}{uaf_prefix[1]}', ''  # Firmware/Signature by Tag prefix
+
+        return uaf_tag, '.bin'  # Could not name the @UAF|@HPU Module, use Tag instead
+
+    @staticmethod
+    def _get_uaf_paths(extract_path: str, uaf_tag: str, uaf_name: str, uaf_fext: str,
+                       uaf_nal: tuple[str, str] | None, is_comp: bool) -> dict[str, str]:
+        """ Get all file and folder paths which a @UAF|@HPU Module may output """
+
+        # Generate @UAF|@HPU Module File name, depending on whether decompression will be required
+        uaf_sname: str = safe_name(in_name=uaf_name + ('.temp' if is_comp else uaf_fext))
+
+        # Place @UAF|@HPU Module File within its @NAL path, if listed
+        uaf_npath: str = safe_path(base_path=extract_path, user_paths=uaf_nal[0]) if uaf_nal else extract_path
+
+        uaf_fname: str = safe_path(base_path=uaf_npath, user_paths=uaf_sname)
+
+        uaf_paths: dict[str, str] = {
+            'file': uaf_fname,  # @UAF|@HPU Module file
+            'dec': uaf_fname.replace('.temp', uaf_fext),  # Decompressed @UAF|@HPU Module file
+            'pfat': extract_folder(os.path.join(extract_path, safe_name(in_name=uaf_name))),  # AMI PFAT folder
+            'ucp': extract_folder(os.path.join(extract_path, safe_name(in_name=f'{uaf_tag}_nested-UCP')))
+        }
+
+        if uaf_tag == '@UII':
+            uaf_paths['uii'] = uaf_fname[:-4] + '.txt'  # @UII Module Info text file
+
+        if uaf_tag == '@DIS':
+            uaf_paths['dis'] = uaf_paths['dec'][:-3] + 'txt'  # @DIS Module Header & Entries text file
+
+        if uaf_tag == '@INS':
+            uaf_paths['ifd'] = extract_folder(os.path.join(extract_path, safe_name(in_name=f'{uaf_tag}_nested-IFD')))
+
+        return uaf_paths
+
+    def _uaf_extract(self, buffer: memoryview, extract_path: str, mod_info: list,
                      nal_dict: dict[str, tuple[str, str]], padding: int = 0) -> dict[str, tuple[str, str]]:
         """ Parse & Extract AMI UCP > @UAF|@HPU Module/Section """
 
         uaf_tag: str = mod_info[0]
         uaf_off: int = mod_info[1]
-        uaf_hdr: Any = mod_info[2]
+        uaf_size: int = mod_info[2]
 
-        uaf_data_all: bytes = buffer[uaf_off:uaf_off + uaf_hdr.ModuleSize]  # @UAF|@HPU Module Entire Data
+        # Parse @UAF|@HPU Module Header Structure
+        uaf_hdr: Any = ctypes_struct(buffer=buffer, start_offset=uaf_off, class_object=UafHeader)
 
-        uaf_data_mod: bytes = uaf_data_all[self.UAF_HDR_LEN:]  # @UAF|@HPU Module EFI Data
+        uaf_data_mod: memoryview = buffer[uaf_off + self.UAF_HDR_LEN:uaf_off + uaf_size]  # @UAF|@HPU Module EFI Data
 
-        uaf_data_raw: bytes = uaf_data_mod[self.UAF_MOD_LEN:]  # @UAF|@HPU Module Raw Data
+        uaf_data_raw: bytes | memoryview = uaf_data_mod[self.UAF_MOD_LEN:]  # @UAF|@HPU Module Raw Data
 
         printer(message=f'Utility Auxiliary File > {uaf_tag}:\n', padding=padding)
 
@@ -411,55 +651,34 @@ class AmiUcpExtract(BIOSUtility):
 
         is_comp: bool = uaf_mod.CompressSize != uaf_mod.OriginalSize  # Detect @UAF|@HPU Module EFI Compression
 
-        if uaf_tag in nal_dict:
-            uaf_name: str = nal_dict[uaf_tag][1]  # Always prefer @NAL naming first
-        elif uaf_tag in self.UAF_TAG_DICT:
-            uaf_name = self.UAF_TAG_DICT[uaf_tag][0]  # Otherwise use built-in naming
-        elif uaf_tag == '@ROM':
-            uaf_name = 'BIOS.bin'  # BIOS/PFAT Firmware (w/o Signature)
-        elif uaf_tag.startswith('@R0'):
-            uaf_name = f'BIOS_0{uaf_tag[3:]}.bin'  # BIOS/PFAT Firmware
-        elif uaf_tag.startswith('@S0'):
-            uaf_name = f'BIOS_0{uaf_tag[3:]}.sig'  # BIOS/PFAT Signature
-        elif uaf_tag.startswith('@DR'):
-            uaf_name = f'DROM_0{uaf_tag[3:]}.bin'  # Thunderbolt Retimer Firmware
-        elif uaf_tag.startswith('@DS'):
-            uaf_name = f'DROM_0{uaf_tag[3:]}.sig'  # Thunderbolt Retimer Signature
-        elif uaf_tag.startswith('@EC'):
-            uaf_name = f'EC_0{uaf_tag[3:]}.bin'  # Embedded Controller Firmware
-        elif uaf_tag.startswith('@ME'):
-            uaf_name = f'ME_0{uaf_tag[3:]}.bin'  # Management Engine Firmware
-        else:
-            uaf_name = uaf_tag  # Could not name the @UAF|@HPU Module, use Tag instead
+        uaf_nal: tuple[str, str] | None = nal_dict.get(uaf_tag)  # @NAL Path & Name, if listed
+
+        uaf_info: list[str] | None = self.UAF_TAG_DICT.get(uaf_tag)  # Built-in Name, Description & Type, if known
 
-        uaf_fext: str = '' if uaf_name != uaf_tag else '.bin'
+        uaf_name, uaf_fext = self._get_uaf_name(uaf_tag=uaf_tag, uaf_nal=uaf_nal, uaf_info=uaf_info)
 
-        uaf_fdesc: str = self.UAF_TAG_DICT[uaf_tag][1] if uaf_tag in self.UAF_TAG_DICT else uaf_name
+        uaf_fdesc: str = uaf_info[1] if uaf_info else uaf_name
 
         # Print @UAF|@HPU Module EFI Info
         uaf_mod.struct_print(filename=uaf_name + uaf_fext, description=uaf_fdesc, padding=padding + 4)
 
         # Check if unknown @UAF|@HPU Module Tag is present in @NAL but not in built-in dictionary
-        if uaf_tag in nal_dict and uaf_tag not in self.UAF_TAG_DICT and \
-                not uaf_tag.startswith(('@ROM', '@R0', '@S0', '@DR', '@DS')):
-
-            printer(message=f'Note: Detected new AMI UCP Module {uaf_tag} ({nal_dict[uaf_tag][1]}) in @NAL!',
+        if uaf_nal and not uaf_info and not uaf_tag.startswith(self.UAF_NAL_PREFIXES):
+            printer(message=f'Note: Detected new AMI UCP Module {uaf_tag} ({uaf_nal[1]}) in @NAL!',
                     padding=padding + 4)
 
-        # Generate @UAF|@HPU Module File name, depending on whether decompression will be required
-        uaf_sname: str = safe_name(in_name=uaf_name + ('.temp' if is_comp else uaf_fext))
-
-        if uaf_tag in nal_dict:
-            uaf_npath: str = safe_path(base_path=extract_path, user_paths=nal_dict[uaf_tag][0])
+        # Get @UAF|@HPU Module output paths, shared with the parallel extraction collision check
+        uaf_paths: dict[str, str] = self._get_uaf_paths(extract_path=extract_path, uaf_tag=uaf_tag, uaf_name=uaf_name,
+                                                        uaf_fext=uaf_fext, uaf_nal=uaf_nal, is_comp=is_comp)
 
-            make_dirs(in_path=uaf_npath)
+        uaf_fname: str = uaf_paths['file']
 
-            uaf_fname: str = safe_path(base_path=uaf_npath, user_paths=uaf_sname)
-        else:
-            uaf_fname = safe_path(base_path=extract_path, user_paths=uaf_sname)
+        if uaf_nal:
+            make_dirs(in_path=os.path.dirname(uaf_fname))
 
         if self.checksum:
-            self._chk16_validate(data=uaf_data_all, tag=uaf_tag, padding=padding + 4)
+            # Validate @UAF|@HPU Module Entire Data (Header + EFI Data)
+            self._chk16_validate(data=buffer[uaf_off:uaf_off + uaf_size], tag=uaf_tag, padding=padding + 4)
 
         # Parse Utility Identification Information @UAF|@HPU Module (@UII)
         if uaf_tag == '@UII':
@@ -467,10 +686,10 @@ class AmiUcpExtract(BIOSUtility):
             info_hdr: Any = ctypes_struct(buffer=uaf_data_raw, start_offset=0, class_object=UiiHeader)
 
             # @UII Module Info Data
-            info_data: bytes = uaf_data_raw[max(self.UII_HDR_LEN, info_hdr.InfoSize):info_hdr.UIISize]
+            info_data: bytes = bytes(uaf_data_raw[max(self.UII_HDR_LEN, info_hdr.InfoSize):info_hdr.UIISize])
 
-            # Get @UII Module Info/Description text field
-            info_desc: str = info_data.decode('utf-8', 'ignore').strip('\x00 ')
+            # Get @UII Module Info/Description text field, trimming padding prior to decoding
+            info_desc: str = info_data.strip(b'\x00 ').decode('utf-8', 'ignore').strip('\x00 ')
 
             printer(message='Utility Identification Information:\n', padding=padding + 4)
 
@@ -480,24 +699,19 @@ class AmiUcpExtract(BIOSUtility):
                 self._chk16_validate(data=uaf_data_raw, tag='@UII > Info', padding=padding + 8)
 
             # Store/Save @UII Module Info in file
-            with open(uaf_fname[:-4] + '.txt', 'a', encoding='utf-8') as uii_out:
-                with contextlib.redirect_stdout(uii_out):
-                    info_hdr.struct_print(description=info_desc, padding=0)  # Store @UII Module Info
+            with open(uaf_paths['uii'], 'a', encoding='utf-8') as uii_out:
+                info_hdr.struct_print(description=info_desc, padding=0, out_file=uii_out)  # Store @UII Module Info
 
         # Adjust @UAF|@HPU Module Raw Data for extraction
         if is_comp:
             # Some Compressed @UAF|@HPU Module EFI data lack necessary EOF padding
-            if uaf_mod.CompressSize > len(uaf_data_raw):
-                comp_padd: bytes = b'\x00' * (uaf_mod.CompressSize - len(uaf_data_raw))
-
-                # Add missing padding for decompression
-                uaf_data_raw = uaf_data_mod[:self.UAF_MOD_LEN] + uaf_data_raw + comp_padd
-            else:
-                # Add the EFI/Tiano Compression info before Raw Data
-                uaf_data_raw = uaf_data_mod[:self.UAF_MOD_LEN] + uaf_data_raw
+            comp_padd: bytes = b'\x00' * max(uaf_mod.CompressSize - len(uaf_data_raw), 0)
+
+            # Add the EFI/Tiano Compression info before Raw Data and any missing padding for decompression
+            uaf_data_raw = b''.join((uaf_data_mod[:self.UAF_MOD_LEN], uaf_data_raw, comp_padd))
         else:
             # No compression, extend to end of Original @UAF|@HPU Module size
-            uaf_data_raw = uaf_data_raw[:uaf_mod.OriginalSize]
+            uaf_data_raw = bytes(uaf_data_raw[:uaf_mod.OriginalSize])
 
         # Store/Save @UAF|@HPU Module file
         if uaf_tag != '@UII':  # Skip @UII binary, already parsed
@@ -507,7 +721,7 @@ class AmiUcpExtract(BIOSUtility):
         # @UAF|@HPU Module EFI/Tiano Decompression
         if is_comp and is_efi_compressed(in_object=uaf_data_raw, strict=False):
             # Decompressed @UAF|@HPU Module file path
-            dec_fname: str = uaf_fname.replace('.temp', uaf_fext)
+            dec_fname: str = uaf_paths['dec']
 
             if efi_decompress(in_path=uaf_fname, out_path=dec_fname, padding=padding + 4):
                 with open(dec_fname, 'rb') as dec:
@@ -518,7 +732,7 @@ class AmiUcpExtract(BIOSUtility):
                 uaf_fname = dec_fname  # Adjust @UAF|@HPU Module file path to the decompressed one
 
         # Process and Print known text only @UAF|@HPU Modules (after EFI/Tiano Decompression)
-        if uaf_tag in self.UAF_TAG_DICT and self.UAF_TAG_DICT[uaf_tag][2] == 'Text':
+        if uaf_tag in self.UAF_TEXT_TAGS:
             printer(message=f'{self.UAF_TAG_DICT[uaf_tag][1]}:', padding=padding + 4)
 
             printer(message=uaf_data_raw.decode('utf-8', 'ignore'), padding=padding + 8)
@@ -532,30 +746,30 @@ class AmiUcpExtract(BIOSUtility):
 
             dis_hdr.struct_print(padding=padding + 8)  # Print @DIS Module Raw Header Info
 
-            # Store/Save @DIS Module Header Info in file
-            with open(uaf_fname[:-3] + 'txt', 'a', encoding='utf-8') as dis:
-                with contextlib.redirect_stdout(dis):
-                    dis_hdr.struct_print(padding=0)  # Store @DIS Module Header Info
-
             dis_data: bytes = uaf_data_raw[self.DIS_HDR_LEN:]  # @DIS Module Entries Data
 
-            # Parse all @DIS Module Entries
-            for mod_idx in range(dis_hdr.EntryCount):
-                # Parse @DIS Module Raw Entry Structure
-                dis_mod: Any = ctypes_struct(buffer=dis_data, start_offset=mod_idx * self.DIS_MOD_LEN,
-                                             class_object=DisModule)
+            # Gather @DIS Module Header & Entries Info in memory
+            with io.StringIO() as dis_text:
+                dis_hdr.struct_print(padding=0, out_file=dis_text)  # Store @DIS Module Header Info
+
+                # Parse all @DIS Module Entries
+                for mod_idx in range(dis_hdr.EntryCount):
+                    # Parse @DIS Module Raw Entry Structure
+                    dis_mod: Any = ctypes_struct(buffer=dis_data, start_offset=mod_idx * self.DIS_MOD_LEN,
+                                                 class_object=DisModule)
+
+                    printer(message=f'Default Command Status Entry {mod_idx + 1:02d}/{dis_hdr.EntryCount:02d}:\n',
+                            padding=padding + 8)
 
-                printer(message=f'Default Command Status Entry {mod_idx + 1:02d}/{dis_hdr.EntryCount:02d}:\n',
-                        padding=padding + 8)
+                    dis_mod.struct_print(padding=padding + 12)  # Print @DIS Module Raw Entry Info
 
-                dis_mod.struct_print(padding=padding + 12)  # Print @DIS Module Raw Entry Info
+                    printer(message=None, out_file=dis_text)
 
-                # Store/Save @DIS Module Entry Info in file
-                with open(uaf_fname[:-3] + 'txt', 'a', encoding='utf-8') as dis:
-                    with contextlib.redirect_stdout(dis):
-                        printer(message=None)
+                    dis_mod.struct_print(padding=4, out_file=dis_text)  # Store @DIS Module Entry Info
 
-                        dis_mod.struct_print(padding=4)  # Store @DIS Module Entry Info
+                # Store/Save @DIS Module Header & Entries Info in file
+                with open(uaf_paths['dis'], 'a', encoding='utf-8') as dis:
+                    dis.write(dis_text.getvalue())
 
             delete_file(in_path=uaf_fname)  # Delete @DIS Module binary, info exported as text
 
@@ -587,25 +801,23 @@ class AmiUcpExtract(BIOSUtility):
 
         # Parse Insyde BIOS @UAF|@HPU Module (@INS)
         if uaf_tag == '@INS':
-            ins_dir: str = os.path.join(extract_path, safe_name(in_name=f'{uaf_tag}_nested-IFD'))
-
             insyde_ifd_extract: InsydeIfdExtract = InsydeIfdExtract(
-                input_object=uaf_fname, extract_path=extract_folder(ins_dir), padding=padding + 4)
+                input_object=uaf_fname, extract_path=uaf_paths['ifd'], padding=padding + 4)
 
             if insyde_ifd_extract.check_format():
                 if insyde_ifd_extract.parse_format():
                     delete_file(in_path=uaf_fname)  # Delete raw nested Insyde IFD image after successful extraction
 
-        pfat_dir: str = os.path.join(extract_path, safe_name(in_name=uaf_name))
-
-        ami_pfat_extract: AmiPfatExtract = AmiPfatExtract(
-            input_object=uaf_data_raw, extract_path=extract_folder(pfat_dir), padding=padding + 4)
+        # Informational and too small @UAF|@HPU Modules cannot contain an AMI BIOS Guard (PFAT) BIOS image
+        if uaf_tag not in self.UAF_INFO_TAGS and len(uaf_data_raw) > AmiPfatExtract.PFAT_AMI_HDR_LEN:
+            ami_pfat_extract: AmiPfatExtract = AmiPfatExtract(
+                input_object=uaf_data_raw, extract_path=uaf_paths['pfat'], padding=padding + 4)
 
-        # Detect & Unpack AMI BIOS Guard (PFAT) BIOS image
-        if ami_pfat_extract.check_format():
-            ami_pfat_extract.parse_format()
+            # Detect & Unpack AMI BIOS Guard (PFAT) BIOS image
+            if ami_pfat_extract.check_format():
+                ami_pfat_extract.parse_format()
 
-            delete_file(in_path=uaf_fname)  # Delete raw PFAT BIOS image after successful extraction
+                delete_file(in_path=uaf_fname)  # Delete raw PFAT BIOS image after successful extraction
 
         # Detect Intel Engine firmware image and show ME Analyzer advice
         if uaf_tag.startswith('@ME') and PAT_INTEL_ENGINE.search(uaf_data_raw):
@@ -613,15 +825,16 @@ class AmiUcpExtract(BIOSUtility):
             printer(message='Use "ME Analyzer" from https://github.com/platomav/MEAnalyzer',
                     padding=padding + 8, new_line=False)
 
-        uaf_dir: str = extract_folder(os.path.join(extract_path, safe_name(in_name=f'{uaf_tag}_nested-UCP')))
-
-        ami_ucp_extract: AmiUcpExtract = AmiUcpExtract(
-            input_object=uaf_data_raw, extract_path=uaf_dir, padding=padding + 4, checksum=self.checksum)
+        # Text and Signature @UAF|@HPU Modules cannot contain a Nested AMI UCP image
+        if uaf_tag not in self.UAF_TEXT_TAGS and uaf_tag[:3] not in self.UAF_SIG_PREFIXES:
+            ami_ucp_extract: AmiUcpExtract = AmiUcpExtract(input_object=uaf_data_raw, extract_path=uaf_paths['ucp'],
+                                                           padding=padding + 4, checksum=self.checksum,
+                                                           workers=self.workers)
 
-        # Parse Nested AMI UCP image
-        if ami_ucp_extract.check_format():
-            ami_ucp_extract.parse_format()
+            # Parse Nested AMI UCP image
+            if ami_ucp_extract.check_format():
+                ami_ucp_extract.parse_format()
 
-            delete_file(in_path=uaf_fname)  # Delete raw nested AMI UCP image after successful extraction
+                delete_file(in_path=uaf_fname)  # Delete raw nested AMI UCP image after successful extraction
 
         return nal_dict
@@ -2,17 +2,35 @@
 # coding=utf-8
 
 """
-Copyright (C) 2022-2024 Plato Mavropoulos
+Copyright (C) 2022-2025 Plato Mavropoulos
 """
 
+import array
+import sys
+
 
 # Get Checksum 16-bit
-def checksum_16(data: bytes | bytearray, value: int = 0, order: str = 'little') -> int:
+def checksum_16(data: bytes | bytearray | memoryview, value: int = 0, order: str = 'little') -> int:
     """ Calculate Checksum-16 of data, controlling IV and Endianess """
 
-    for idx in range(0, len(data), 2):
-        # noinspection PyTypeChecker
-        value += int.from_bytes(data[idx:idx + 2], byteorder=order)  # type: ignore
+    data_view: memoryview = memoryview(data)
+
+    data_even: int = len(data_view) & ~0x1
+
+    if order == sys.byteorder:
+        # Sum native 16-bit words directly from the underlying buffer
+        value += sum(data_view[:data_even].cast('H'))
+    else:
+        data_words: array.array = array.array('H')
+
+        data_words.frombytes(data_view[:data_even])
+
+        data_words.byteswap()  # Adjust 16-bit words to native Endianess
+
+        value += sum(data_words)
+
+    if data_even != len(data_view):
+        value += data_view[-1]  # Odd trailing byte
 
     value &= 0xFFFF
 
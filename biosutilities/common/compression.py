@@ -2,7 +2,7 @@
 # coding=utf-8
 
 """
-Copyright (C) 2022-2024 Plato Mavropoulos
+Copyright (C) 2022-2025 Plato Mavropoulos
 """
 
 import subprocess
@@ -119,7 +119,11 @@ def efi_decompress(in_path: str, out_path: str, padding: int = 0, silent: bool =
     tiano_x: subprocess.CompletedProcess[bytes] = subprocess.run(tiano_c, check=False, stdout=subprocess.DEVNULL)
 
     if tiano_x.returncode == 0 and is_file_read(in_path=out_path):
-        if efi_header_info(in_object=in_path)['size_decompressed'] == path_size(in_path=out_path):
+        # Read only the EFI compression header, not the entire compressed input file
+        with open(in_path, 'rb') as efi_file:
+            efi_header: bytes = efi_file.read(0x8)
+
+        if efi_header_info(in_object=efi_header)['size_decompressed'] == path_size(in_path=out_path):
             if not silent:
                 printer(message='Successful EFI decompression via TianoCompress!', padding=padding)
 
@@ -11,6 +11,7 @@ import shutil
 import stat
 import sys
 
+from functools import lru_cache
 from pathlib import Path, PurePath
 from typing import Callable, Final
 
@@ -20,6 +21,7 @@ from biosutilities.common.texts import to_string
 MAX_WIN_COMP_LEN: Final[int] = 255
 
 
+@lru_cache(maxsize=256)
 def safe_name(in_name: str) -> str:
     """
     Fix illegal/reserved Windows characters
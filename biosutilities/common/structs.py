@@ -16,7 +16,7 @@ UINT32: Final[Any] = ctypes.c_uint
 UINT64: Final[Any] = ctypes.c_uint64
 
 
-def ctypes_struct(buffer: bytes | bytearray, start_offset: int, class_object: Any,
+def ctypes_struct(buffer: bytes | bytearray | memoryview, start_offset: int, class_object: Any,
                   param_list: list | None = None) -> Any:
     """
     https://github.com/skochinsky/me-tools/blob/master/me_unpack.py by Igor Skochinsky
@@ -29,7 +29,7 @@ def ctypes_struct(buffer: bytes | bytearray, start_offset: int, class_object: An
 
     struct_len: int = ctypes.sizeof(structure)
 
-    struct_data: bytes | bytearray = buffer[start_offset:start_offset + struct_len]
+    struct_data: bytes = bytes(buffer[start_offset:start_offset + struct_len])
 
     least_len: int = min(len(struct_data), struct_len)
 
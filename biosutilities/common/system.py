@@ -2,12 +2,14 @@
 # coding=utf-8
 
 """
-Copyright (C) 2022-2024 Plato Mavropoulos
+Copyright (C) 2022-2025 Plato Mavropoulos
 """
 
 import sys
 import platform
 
+from typing import TextIO
+
 from biosutilities.common.texts import to_string
 
 
@@ -30,18 +32,20 @@ def python_version() -> tuple:
 
 
 def printer(message: str | list | tuple | None = None, padding: int = 0, new_line: bool = True,
-            sep_char: str = ' ', strip: bool = False) -> None:
-    """ Show message(s), controlling padding, newline, stripping, pausing & separating """
+            sep_char: str = ' ', strip: bool = False, out_file: TextIO | None = None) -> None:
+    """ Show message(s), controlling padding, newline, stripping, pausing, separating & output """
 
     message_string: str = to_string(in_object='' if message is None else message, sep_char=sep_char)
 
     message_output: str = '\n' if new_line else ''
 
+    padding_text: str = ' ' * padding  # Same padding for all message lines
+
     for message_line_index, message_line_text in enumerate(message_string.split('\n')):
         line_new: str = '' if message_line_index == 0 else '\n'
 
         line_text: str = message_line_text.strip() if strip else message_line_text
 
-        message_output += f'{line_new}{" " * padding}{line_text}'
+        message_output += f'{line_new}{padding_text}{line_text}'
 
-    print(message_output)
+    print(message_output, file=out_file)
@@ -5,6 +5,7 @@
 Copyright (C) 2018-2024 Plato Mavropoulos
 """
 
+import multiprocessing
 import os
 import sys
 import traceback
@@ -50,6 +51,7 @@ class BIOSUtilities:
         main_argparser.add_argument('paths', nargs='*')
         main_argparser.add_argument('-e', '--auto-exit', help='do not pause on exit', action='store_true')
         main_argparser.add_argument('-o', '--output-dir', help='extraction directory')
+        main_argparser.add_argument('-w', '--workers', help='AMI UCP extraction processes', type=int, default=1)
 
         self.main_arguments: Namespace = main_argparser.parse_args()
 
@@ -159,7 +161,12 @@ class BIOSUtilities:
 
                             break
 
-                utility: Any = utility_class(input_object=input_file, extract_path=extract_path, padding=padding + 8)
+                # Only AMI UCP Update Extractor supports parallel extraction, via optional worker processes
+                utility_kwargs: dict[str, Any] = {'workers': self.main_arguments.workers} \
+                    if utility_class is AmiUcpExtract else {}
+
+                utility: Any = utility_class(input_object=input_file, extract_path=extract_path, padding=padding + 8,
+                                             **utility_kwargs)
 
                 if not utility.check_format():
                     continue
@@ -185,4 +192,6 @@ class BIOSUtilities:
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # Allow worker processes at frozen (e.g. PyInstaller) executables
+
     BIOSUtilities().run_main()